@@ -0,0 +1,71 @@
+"""
+Keyword Matcher
+===============
+
+Single-scan keyword lookup shared by multi_event_kg_1 (built-in asset
+table) and kg_config_loader (assets from kg_config.yaml).
+
+Usage:
+    from keyword_matcher import KeywordMatcher
+
+    matcher = KeywordMatcher({'gold': ['gold', 'bullion'], 'stocks': ['stocks']})
+    matcher.find('gold and stocks rally')   # {'gold', 'stocks'}
+"""
+
+import re
+from typing import Dict, Iterable, List, Mapping, Set, Tuple
+
+
+class KeywordMatcher:
+    """
+    Find the labels whose keywords appear in a text, word-bounded.
+
+    Every keyword is compiled into one alternation, longest first, wrapped in
+    a lookahead so finditer reports a hit at every start position. Only the
+    longest keyword is reported per position, so the shorter keywords that
+    can start at the same place ('stock' under 'stock futures') are checked
+    again with their own pattern, compiled once per keyword.
+    """
+
+    __slots__ = ('keyword_to_labels', 'pattern', '_prefixes')
+
+    def __init__(self, keyword_map: Mapping[str, Iterable[str]], suffix: str = r'\b'):
+        """
+        Args:
+            keyword_map: {label: keywords}; keywords are matched lowercased
+            suffix: Regex each keyword must be followed by, e.g. r"'?s?\b"
+                to also accept plurals and possessives
+        """
+        # Inverted index: keyword -> label(s) it triggers
+        self.keyword_to_labels: Dict[str, List[str]] = {}
+        for label, keywords in keyword_map.items():
+            for keyword in keywords:
+                self.keyword_to_labels.setdefault(keyword.lower(), []).append(label)
+
+        alternation = '|'.join(
+            re.escape(kw) for kw in sorted(self.keyword_to_labels, key=lambda kw: (-len(kw), kw))
+        )
+        self.pattern: re.Pattern = re.compile(r'(?=\b(' + alternation + ')' + suffix + ')')
+
+        # Keywords without shorter keywords at their start are left out
+        keyword_res = {kw: re.compile(re.escape(kw) + suffix) for kw in self.keyword_to_labels}
+        self._prefixes: Dict[str, Tuple[Tuple[str, re.Pattern], ...]] = {}
+        for keyword in self.keyword_to_labels:
+            prefixes = tuple(
+                (prefix, keyword_res[prefix])
+                for prefix in self.keyword_to_labels
+                if prefix != keyword and keyword.startswith(prefix)
+            )
+            if prefixes:
+                self._prefixes[keyword] = prefixes
+
+    def find(self, text_lower: str) -> Set[str]:
+        """Labels of every keyword in the text, which must already be lowercase."""
+        found: Set[str] = set()
+        for match in self.pattern.finditer(text_lower):
+            keyword = match.group(1)
+            found.update(self.keyword_to_labels[keyword])
+            for prefix, prefix_re in self._prefixes.get(keyword, ()):
+                if prefix_re.match(text_lower, match.start()):
+                    found.update(self.keyword_to_labels[prefix])
+        return found
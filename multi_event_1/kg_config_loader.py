@@ -14,16 +14,32 @@ Usage:
     config = load_kg_config()  # or load_kg_config('path/to/kg_config.yaml')
     
     # Access data
-    config.ASSET_KEYWORDS      # {asset_id: [keywords]}
+    config.ASSET_KEYWORDS      # {asset_id: (keywords)}  ordered, for iteration
+    config.ASSET_KEYWORD_SETS  # {asset_id: frozenset(keywords)}  for membership
+    config.KEYWORD_TO_ASSET    # {keyword: [asset_ids]}
+    config.find_assets(text)   # asset IDs mentioned in text (single regex pass)
     config.EVENT_KEYWORDS      # {event_id: [keywords]}
     config.MOVEMENT_INDICATORS # {strength: [words]}
     config.ASSET_TYPE_MAP      # {asset_id: type}
     config.ASSET_DISPLAY_NAMES # {asset_id: display_name}
 """
 
+import os
+import pickle
+import sys
+import threading
 import yaml
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+from keyword_matcher import KeywordMatcher
+
+# Prefer the libyaml-backed loader; fall back to pure Python if unavailable
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 
 class KGConfig:
@@ -31,7 +47,17 @@ class KGConfig:
     Simplified configuration class for Knowledge Graph extraction.
     Loads from YAML and provides dict-style access for v3 compatibility.
     """
-    
+
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = (
+        'config_path', '_raw_config', 'version', 'last_updated', '_lock',
+        'ASSET_KEYWORDS', 'ASSET_TYPE_MAP', 'ASSET_DISPLAY_NAMES',
+        'ASSET_KEYWORD_SETS', 'KEYWORD_TO_ASSET', '_ASSET_MATCHER',
+        'EVENT_KEYWORDS', 'EVENT_DISPLAY_NAMES', 'EVENT_QUALIFIERS',
+        'MOVEMENT_INDICATORS', 'POSITIVE_KEYWORDS', 'NEGATIVE_KEYWORDS', 'NEUTRAL_KEYWORDS',
+        'RELATION_KEYWORDS',
+    )
+
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize the configuration.
@@ -45,83 +71,168 @@ class KGConfig:
         
         self.config_path = Path(config_path)
         self._load_config()
-        self._build_dicts()
+        # Sections are built on first access, see __getattr__; reentrant in
+        # case a builder reads another lazy section
+        self._lock = threading.RLock()
     
     def _load_config(self):
         """Load the YAML configuration file."""
         if not self.config_path.exists():
             raise FileNotFoundError(f"Config file not found: {self.config_path}")
         
-        with open(self.config_path, 'r', encoding='utf-8') as f:
-            self._raw_config = yaml.safe_load(f)
+        # Reuse the pickled parse if the YAML is unchanged (same mtime + size)
+        stat = self.config_path.stat()
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        cache_path = self.config_path.with_name(self.config_path.name + '.pkl')
+        
+        self._raw_config = self._read_cache(cache_path, cache_key)
+        if self._raw_config is None:
+            with open(self.config_path, 'r', encoding='utf-8') as f:
+                self._raw_config = yaml.load(f.read(), Loader=_YamlLoader)
+            self._write_cache(cache_path, cache_key)
         
         self.version = self._raw_config.get('version', '1.0')
         self.last_updated = self._raw_config.get('last_updated', 'unknown')
     
-    def _build_dicts(self):
-        """Build dictionaries for easy access."""
-        
-        # =====================================================================
-        # ASSET DATA
-        # =====================================================================
-        self.ASSET_KEYWORDS: Dict[str, List[str]] = {}
-        self.ASSET_TYPE_MAP: Dict[str, str] = {}
-        self.ASSET_DISPLAY_NAMES: Dict[str, str] = {}
+    @staticmethod
+    def _read_cache(cache_path: Path, cache_key: tuple) -> Optional[dict]:
+        """Return the cached raw config if its key matches, else None."""
+        try:
+            with open(cache_path, 'rb') as f:
+                if pickle.load(f) == cache_key:
+                    return pickle.load(f)
+        except Exception:
+            # A corrupt, truncated or incompatible cache (unpickling can raise
+            # almost anything, e.g. MemoryError or ValueError) falls back to
+            # parsing the YAML
+            pass
+        return None
+    
+    def _write_cache(self, cache_path: Path, cache_key: tuple):
+        """Atomically write the parsed config next to the YAML (best effort)."""
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(cache_key, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(self._raw_config, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # Read-only install locations simply skip caching
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
+    def __getattr__(self, name: str):
+        """Build the section that defines `name` on first access."""
+        # Only reached while the slot is still unset; later reads are plain
+        # slot lookups, so lazy sections cost nothing once built
+        builder = _SECTION_BUILDERS.get(name)
+        if builder is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        with self._lock:
+            # Another thread may have built the section while this one waited
+            try:
+                return object.__getattribute__(self, name)
+            except AttributeError:
+                getattr(self, builder)()
+        return object.__getattribute__(self, name)
+    
+    # Each builder works on locals and assigns its slots together at the
+    # end, so a section is either absent or complete: a failed build leaves
+    # nothing behind and is retried on the next access
+    
+    def _build_assets(self):
+        """Build asset keyword, type and display-name maps."""
+        asset_keywords: Dict[str, Tuple[str, ...]] = {}
+        asset_types: Dict[str, str] = {}
+        display_names: Dict[str, str] = {}
         
+        # Fill all three maps in one traversal of the asset subtree
         for asset_id, asset_data in self._raw_config.get('assets', {}).items():
-            self.ASSET_KEYWORDS[asset_id] = asset_data.get('keywords', [])
-            self.ASSET_TYPE_MAP[asset_id] = asset_data.get('type', 'unknown')
-            self.ASSET_DISPLAY_NAMES[asset_id] = asset_data.get('display_name', asset_id)
+            # Interned IDs: one shared string per ID across maps and edges
+            asset_id = sys.intern(asset_id)
+            asset_keywords[asset_id] = tuple(asset_data.get('keywords', ()))
+            asset_types[asset_id] = asset_data.get('type', 'unknown')
+            display_names[asset_id] = asset_data.get('display_name', asset_id)
+        
+        # Same keywords as sets: O(1) `word in keywords` checks
+        keyword_sets: Dict[str, FrozenSet[str]] = {
+            asset_id: frozenset(keywords) for asset_id, keywords in asset_keywords.items()
+        }
         
-        # =====================================================================
-        # EVENT DATA
-        # =====================================================================
-        self.EVENT_KEYWORDS: Dict[str, List[str]] = {}
-        self.EVENT_DISPLAY_NAMES: Dict[str, str] = {}
-        self.EVENT_QUALIFIERS: Dict[str, Dict[str, List[str]]] = {}
+        # One matcher over every keyword (plurals and possessives included)
+        # so tagging a headline is a single scan
+        asset_matcher = KeywordMatcher(asset_keywords, suffix=r"'?s?\b")
+        
+        self.ASSET_KEYWORDS = asset_keywords
+        self.ASSET_TYPE_MAP = asset_types
+        self.ASSET_DISPLAY_NAMES = display_names
+        self.ASSET_KEYWORD_SETS = keyword_sets
+        self.KEYWORD_TO_ASSET = asset_matcher.keyword_to_labels
+        self._ASSET_MATCHER = asset_matcher
+    
+    def _build_events(self):
+        """Build event keyword, display-name and qualifier maps."""
+        event_keywords: Dict[str, List[str]] = {}
+        display_names: Dict[str, str] = {}
+        qualifiers: Dict[str, Dict[str, List[str]]] = {}
         
         for event_id, event_data in self._raw_config.get('events', {}).items():
-            self.EVENT_KEYWORDS[event_id] = event_data.get('keywords', [])
-            self.EVENT_DISPLAY_NAMES[event_id] = event_data.get('display_name', event_id)
-            self.EVENT_QUALIFIERS[event_id] = event_data.get('qualifiers', {})
+            event_id = sys.intern(event_id)
+            event_keywords[event_id] = event_data.get('keywords', [])
+            display_names[event_id] = event_data.get('display_name', event_id)
+            qualifiers[event_id] = event_data.get('qualifiers', {})
         
-        # =====================================================================
-        # MOVEMENT INDICATORS
-        # =====================================================================
-        self.MOVEMENT_INDICATORS: Dict[str, List[str]] = self._raw_config.get('movement_indicators', {})
+        self.EVENT_KEYWORDS = event_keywords
+        self.EVENT_DISPLAY_NAMES = display_names
+        self.EVENT_QUALIFIERS = qualifiers
+    
+    def _build_movement(self):
+        """Build movement indicators and the flattened polarity lists."""
+        indicators: Dict[str, List[str]] = self._raw_config.get('movement_indicators', {})
         
         # Flattened positive/negative/neutral lists for convenience
-        self.POSITIVE_KEYWORDS: List[str] = (
-            self.MOVEMENT_INDICATORS.get('strong_positive', []) +
-            self.MOVEMENT_INDICATORS.get('positive', [])
-        )
-        self.NEGATIVE_KEYWORDS: List[str] = (
-            self.MOVEMENT_INDICATORS.get('strong_negative', []) +
-            self.MOVEMENT_INDICATORS.get('negative', [])
-        )
-        self.NEUTRAL_KEYWORDS: List[str] = self.MOVEMENT_INDICATORS.get('neutral', [])
-        
-        # =====================================================================
-        # RELATION DATA
-        # =====================================================================
-        self.RELATION_KEYWORDS: Dict[str, List[str]] = {}
+        positive: List[str] = list(chain(
+            indicators.get('strong_positive', ()),
+            indicators.get('positive', ()),
+        ))
+        negative: List[str] = list(chain(
+            indicators.get('strong_negative', ()),
+            indicators.get('negative', ()),
+        ))
         
-        for rel_name, rel_data in self._raw_config.get('relations', {}).items():
-            indicators = rel_data.get('indicators', {})
-            if isinstance(indicators, dict):
-                # Flatten nested indicators (strong/moderate/weak)
-                all_indicators = []
-                for strength_indicators in indicators.values():
-                    if isinstance(strength_indicators, list):
-                        all_indicators.extend(strength_indicators)
-                self.RELATION_KEYWORDS[rel_name] = all_indicators
-            elif isinstance(indicators, list):
-                self.RELATION_KEYWORDS[rel_name] = indicators
+        self.MOVEMENT_INDICATORS = indicators
+        self.POSITIVE_KEYWORDS = positive
+        self.NEGATIVE_KEYWORDS = negative
+        self.NEUTRAL_KEYWORDS = indicators.get('neutral', [])
+    
+    def _build_relations(self):
+        """Build flattened relation indicator keywords."""
+        relation_indicators = (
+            (sys.intern(rel_name), rel_data.get('indicators', {}))
+            for rel_name, rel_data in self._raw_config.get('relations', {}).items()
+        )
+        self.RELATION_KEYWORDS = {
+            # Flatten nested indicators (strong/moderate/weak)
+            rel_name: (
+                list(chain.from_iterable(
+                    group for group in indicators.values() if isinstance(group, list)
+                ))
+                if isinstance(indicators, dict) else indicators
+            )
+            for rel_name, indicators in relation_indicators
+            if isinstance(indicators, (dict, list))
+        }
     
     # =========================================================================
     # HELPER METHODS
     # =========================================================================
     
+    def find_assets(self, text: str) -> Set[str]:
+        """Get the IDs of all assets whose keywords appear in the text."""
+        return self._ASSET_MATCHER.find(text.lower())
+    
     def get_asset_type(self, asset_id: str) -> str:
         """Get the type of an asset."""
         return self.ASSET_TYPE_MAP.get(asset_id, 'unknown')
@@ -147,11 +258,26 @@ class KGConfig:
         )
 
 
+# Lazily built attribute -> KGConfig method that builds its section
+_SECTION_BUILDERS: Dict[str, str] = {
+    **dict.fromkeys((
+        'ASSET_KEYWORDS', 'ASSET_TYPE_MAP', 'ASSET_DISPLAY_NAMES',
+        'ASSET_KEYWORD_SETS', 'KEYWORD_TO_ASSET', '_ASSET_MATCHER',
+    ), '_build_assets'),
+    **dict.fromkeys(('EVENT_KEYWORDS', 'EVENT_DISPLAY_NAMES', 'EVENT_QUALIFIERS'), '_build_events'),
+    **dict.fromkeys((
+        'MOVEMENT_INDICATORS', 'POSITIVE_KEYWORDS', 'NEGATIVE_KEYWORDS', 'NEUTRAL_KEYWORDS',
+    ), '_build_movement'),
+    'RELATION_KEYWORDS': '_build_relations',
+}
+
+
 # =============================================================================
 # MODULE-LEVEL LOADER FUNCTION
 # =============================================================================
 
 _config_instance: Optional[KGConfig] = None
+_config_lock = threading.Lock()
 
 
 def load_kg_config(config_path: Optional[str] = None, reload: bool = False) -> KGConfig:
@@ -167,8 +293,11 @@ def load_kg_config(config_path: Optional[str] = None, reload: bool = False) -> K
     """
     global _config_instance
     
+    # Double-checked locking: concurrent first callers parse the YAML once
     if _config_instance is None or reload:
-        _config_instance = KGConfig(config_path)
+        with _config_lock:
+            if _config_instance is None or reload:
+                _config_instance = KGConfig(config_path)
     
     return _config_instance
 
@@ -7,12 +7,24 @@ This script provides accurate coverage analysis by comparing:
 3. Edges extracted (headlines that resulted in causal relationships)
 """
 
-import json
 import pandas as pd
-from collections import Counter, defaultdict
+from collections import Counter
 import re
 import os
 
+# Optional: orjson parses the KG JSON several times faster than stdlib json
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Optional: Arrow-backed strings run str.contains in Arrow's C++ regex kernel
+try:
+    import pyarrow as pa
+    _ARROW_STRING = pd.ArrowDtype(pa.string())
+except ImportError:
+    _ARROW_STRING = None
+
 # ============================================================================
 # CONFIGURATION - Edit these values to change file paths and settings
 # ============================================================================
@@ -22,123 +34,149 @@ CONFIG = {
     'sample_headlines_count': 10,  # Number of sample headlines to display
 }
 
+# ============================================================================
+# EVENT KEYWORDS - same detection lists as the extractor, built once at import
+# ============================================================================
+RATE_CUT_KW = (
+    'rate cut', 'rate cuts', 'rate cut bets', 'rate cut hopes',
+    'rate cut optimism', 'rate cut view', 'rate cut outlook',
+    'rate cut speculation', 'fed cut', 'us rate cut', 'rate cut doubts',
+    'rate cut fears', 'rate reduction', 'rate easing', 'rate cut looms',
+    'rate cut anticipated', 'rate cut expected', 'rate cut possibility',
+    'rate cut ideas', 'emergency rate cut'
+)
+
+RATE_HIKE_KW = (
+    'rate hike', 'rate hikes', 'rate increase', 'rate rise',
+    'fed hike', 'hike outlook', 'hike path', 'rate tightening',
+    'taper', 'tapering', 'qe taper', 'quantitative easing'
+)
+
+EMPLOYMENT_KW = (
+    'nonfarm payrolls', 'nonfarm payroll', 'payrolls', 'payroll',
+    'jobs report', 'employment report', 'employment data',
+    'unemployment rate', 'jobless rate', 'unemployment data', 'jobs data',
+    'labor market', 'labour market', 'employment',
+    'nfp', 'jolts', 'adp', 'jobless claims', 'unemployment',
+    'labor market data', 'employment growth', 'job growth',
+    'hiring', 'layoffs', 'wage growth', 'wages', 'earnings',
+    'job loss', 'job gains', 'job losses', 'jobs added',
+    'claims fall', 'claims rise',
+    'upbeat jobs report', 'weak jobs report', 'strong jobs report',
+)
+
+def minimize_keywords(keywords):
+    """
+    Drop duplicates and any keyword that contains another keyword.
+    For presence checks 'rate cut bets' is redundant once 'rate cut' is
+    scanned, so the minimized list matches exactly the same titles.
+    """
+    unique = set(keywords)
+    return [
+        kw for kw in sorted(unique, key=lambda kw: (-len(kw), kw))
+        if not any(other != kw and other in kw for other in unique)
+    ]
+
+def compile_keywords(keywords):
+    """Compile a keyword list into one literal alternation (substring semantics)"""
+    return re.compile('|'.join(re.escape(kw) for kw in minimize_keywords(keywords)))
+
+# One compiled scan per event class instead of a Python `in` per keyword
+EVENT_PATTERNS = {
+    'rate_cut': compile_keywords(RATE_CUT_KW),
+    'rate_hike': compile_keywords(RATE_HIKE_KW),
+    'employment': compile_keywords(EMPLOYMENT_KW)
+}
+ALL_EVENT_KW_PATTERN = compile_keywords(RATE_CUT_KW + RATE_HIKE_KW + EMPLOYMENT_KW)
+
+def contains_keywords(titles, pattern):
+    """Boolean array: which titles match a pattern from compile_keywords()."""
+    if _ARROW_STRING is None:
+        return titles.str.contains(pattern).to_numpy(dtype=bool)
+    if titles.dtype != _ARROW_STRING:
+        titles = titles.astype(_ARROW_STRING)
+    # Arrow takes the pattern source (plain escaped alternation, re2-safe)
+    return titles.str.contains(pattern.pattern).to_numpy(dtype=bool)
+
 def load_data():
     """Load raw data and KG"""
-    df = pd.read_csv(CONFIG['input_csv'])
-    with open(CONFIG['output_kg_json'], 'r') as f:
-        kg = json.load(f)
+    # Only the title and category columns are used downstream
+    df = pd.read_csv(
+        CONFIG['input_csv'],
+        usecols=['title_lower', 'event_category'],
+        dtype={'event_category': 'category'},
+    )
+    with open(CONFIG['output_kg_json'], 'rb') as f:
+        kg = _json_loads(f.read())
     return df, kg
 
 def extract_event_keywords():
-    """Extract event detection keywords from the code"""
-    rate_cut_keywords = [
-        'rate cut', 'rate cuts', 'rate cut bets', 'rate cut hopes',
-        'rate cut optimism', 'rate cut view', 'rate cut outlook',
-        'rate cut speculation', 'fed cut', 'us rate cut', 'rate cut doubts',
-        'rate cut fears', 'rate reduction', 'rate easing', 'rate cut looms',
-        'rate cut anticipated', 'rate cut expected', 'rate cut possibility',
-        'rate cut ideas', 'emergency rate cut'
-    ]
-    
-    rate_hike_keywords = [
-        'rate hike', 'rate hikes', 'rate increase', 'rate rise',
-        'fed hike', 'hike outlook', 'hike path', 'rate tightening',
-        'taper', 'tapering', 'qe taper', 'quantitative easing'
-    ]
-    
-    employment_keywords = [
-        'nonfarm payrolls', 'nonfarm payroll', 'payrolls', 'payroll',
-        'jobs report', 'employment report', 'employment data',
-        'unemployment rate', 'jobless rate', 'unemployment data', 'jobs data',
-        'labor market', 'labour market', 'employment',
-        'nfp', 'jolts', 'adp', 'jobless claims', 'unemployment',
-        'labor market data', 'employment growth', 'job growth',
-        'hiring', 'layoffs', 'wage growth', 'wages', 'earnings',
-        'job loss', 'job gains', 'job losses', 'jobs added',
-        'jobless claims', 'claims fall', 'claims rise',
-        'upbeat jobs report', 'weak jobs report', 'strong jobs report',
-    ]
-    
-    return rate_cut_keywords, rate_hike_keywords, employment_keywords
+    """Return the event detection keywords (kept for backwards compatibility)"""
+    return RATE_CUT_KW, RATE_HIKE_KW, EMPLOYMENT_KW
 
-def detect_events_in_headlines(df):
+def lower_titles(df):
+    """Lowercased titles, one per row (missing titles become 'nan')"""
+    return df['title_lower'].astype(str).str.lower()
+
+def detect_events_in_headlines(df, titles=None):
     """
     Manually detect events in all headlines using the same logic as the extractor.
     Returns detailed statistics about event detection.
+    Pass titles from lower_titles() to reuse an already lowercased column.
     """
-    rate_cut_kw, rate_hike_kw, employment_kw = extract_event_keywords()
+    if titles is None:
+        titles = lower_titles(df)
+    
+    # Vectorized scan: one boolean mask per event class. Each distinct title
+    # is scanned once and the flags are broadcast back to duplicate rows.
+    unique_titles = titles.drop_duplicates()
+    scan_titles = unique_titles if _ARROW_STRING is None else unique_titles.astype(_ARROW_STRING)
+    flags = pd.DataFrame({
+        event: contains_keywords(scan_titles, pattern)
+        for event, pattern in EVENT_PATTERNS.items()
+    }, index=unique_titles.to_numpy())
+    masks = {
+        event: titles.map(flags[event]).astype(bool)
+        for event in EVENT_PATTERNS
+    }
+    event_counts = sum(mask.astype(int) for mask in masks.values())
     
     results = {
         'total_headlines': len(df),
-        'has_rate_cut': 0,
-        'has_rate_hike': 0,
-        'has_employment': 0,
-        'has_any_event': 0,
-        'has_multiple_events': 0,
-        'no_event': 0,
-        'headlines_by_event': defaultdict(list)
+        'has_rate_cut': int(masks['rate_cut'].sum()),
+        'has_rate_hike': int(masks['rate_hike'].sum()),
+        'has_employment': int(masks['employment'].sum()),
+        'has_any_event': int((event_counts > 0).sum()),
+        'has_multiple_events': int((event_counts > 1).sum()),
+        'no_event': int((event_counts == 0).sum()),
+        # One vectorized slice per event class (empty list if none matched)
+        'headlines_by_event': {event: titles[mask].tolist() for event, mask in masks.items()}
     }
     
-    for idx, row in df.iterrows():
-        title = str(row.get('title_lower', '')).lower()
-        
-        detected = {
-            'rate_cut': any(kw in title for kw in rate_cut_kw),
-            'rate_hike': any(kw in title for kw in rate_hike_kw),
-            'employment': any(kw in title for kw in employment_kw)
-        }
-        
-        event_count = sum(detected.values())
-        
-        if detected['rate_cut']:
-            results['has_rate_cut'] += 1
-            results['headlines_by_event']['rate_cut'].append(title)
-        if detected['rate_hike']:
-            results['has_rate_hike'] += 1
-            results['headlines_by_event']['rate_hike'].append(title)
-        if detected['employment']:
-            results['has_employment'] += 1
-            results['headlines_by_event']['employment'].append(title)
-        
-        if event_count > 0:
-            results['has_any_event'] += 1
-        if event_count > 1:
-            results['has_multiple_events'] += 1
-        if event_count == 0:
-            results['no_event'] += 1
-    
     return results
 
-def analyze_kg_coverage(kg):
+def analyze_kg_coverage(kg, headlines_with_edges=None):
     """
     Analyze what the KG actually captured.
+    Pass the set from get_headlines_with_edges() to avoid walking the edges twice.
     """
-    # Get unique headlines from evidence
-    unique_headlines_in_kg = set()
-    
-    for edge in kg['edges']:
-        for evidence in edge.get('evidence', []):
-            title = evidence.get('title', '')
-            if title:
-                unique_headlines_in_kg.add(title.lower())
+    if headlines_with_edges is None:
+        headlines_with_edges = get_headlines_with_edges(kg)
     
     return {
-        'unique_headlines_with_edges': len(unique_headlines_in_kg),
+        'unique_headlines_with_edges': len(headlines_with_edges),
         'total_edges': len(kg['edges']),
         'total_nodes': len(kg['nodes'])
     }
 
 def get_headlines_with_edges(kg):
     """Get the actual set of headlines that resulted in edges"""
-    headlines_with_edges = set()
-    
-    for edge in kg['edges']:
-        for evidence in edge.get('evidence', []):
-            title = evidence.get('title', '')
-            if title:
-                headlines_with_edges.add(title.lower())
-    
-    return headlines_with_edges
+    return {
+        evidence['title'].lower()
+        for edge in kg['edges']
+        for evidence in edge.get('evidence', ())
+        if evidence.get('title')
+    }
 
 def main():
     print("="*80)
@@ -147,10 +185,7 @@ def main():
     
     # Load data
     df, kg = load_data()
-    
-    # Extract event keywords once to avoid repetition
-    rate_cut_kw, rate_hike_kw, employment_kw = extract_event_keywords()
-    all_event_keywords = rate_cut_kw + rate_hike_kw + employment_kw
+    titles_lower = lower_titles(df)
     
     print("\n## 1. INPUT DATA")
     print("-"*40)
@@ -161,7 +196,7 @@ def main():
     # Detect events in all headlines
     print("\n## 2. EVENT DETECTION COVERAGE")
     print("-"*40)
-    event_results = detect_events_in_headlines(df)
+    event_results = detect_events_in_headlines(df, titles_lower)
     
     print(f"Headlines with ANY event detected: {event_results['has_any_event']} / {event_results['total_headlines']}")
     print(f"  Coverage: {event_results['has_any_event']/event_results['total_headlines']*100:.1f}%")
@@ -175,8 +210,8 @@ def main():
     # Analyze KG output
     print("\n## 3. KG EXTRACTION COVERAGE")
     print("-"*40)
-    kg_stats = analyze_kg_coverage(kg)
     headlines_with_edges = get_headlines_with_edges(kg)
+    kg_stats = analyze_kg_coverage(kg, headlines_with_edges)
     
     print(f"Unique headlines that resulted in edges: {kg_stats['unique_headlines_with_edges']}")
     print(f"Total edges created: {kg_stats['total_edges']}")
@@ -200,11 +235,8 @@ def main():
     print("\n## 5. GAP ANALYSIS: Events Detected but No Edges Created")
     print("-"*40)
     
-    detected_titles = set()
-    for title in df['title_lower'].dropna():
-        title_lower = title.lower()
-        if any(kw in title_lower for kw in all_event_keywords):
-            detected_titles.add(title_lower)
+    known_titles = titles_lower[df['title_lower'].notna()].drop_duplicates()
+    detected_titles = set(known_titles[contains_keywords(known_titles, ALL_EVENT_KW_PATTERN)])
     
     no_edge_headlines = detected_titles - headlines_with_edges
     print(f"Headlines with events but NO edges: {len(no_edge_headlines)}")
@@ -228,12 +260,7 @@ def main():
         print(f"\nThese headlines do not mention any economic event (employment, rate cut, rate hike):")
         
         # Get all headlines without events
-        no_event_headlines = []
-        for idx, row in df.iterrows():
-            title = str(row.get('title_lower', '')).lower()
-            has_event = any(kw in title for kw in all_event_keywords)
-            if not has_event:
-                no_event_headlines.append(title)
+        no_event_headlines = titles_lower[~contains_keywords(titles_lower, ALL_EVENT_KW_PATTERN)].tolist()
         
         for i, title in enumerate(no_event_headlines, 1):
             print(f"  {i}. {title}")
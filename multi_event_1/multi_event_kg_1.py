@@ -17,11 +17,22 @@ Enhanced multi-event architecture with 5 layers:
 """
 
 import re
+import sys
 import json
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 import pandas as pd
-from typing import List, Dict, Set, Tuple, Optional
+from typing import AbstractSet, Any, Callable, DefaultDict, Final, Iterable, List, Dict, Set, FrozenSet, Tuple, Optional
+
+from keyword_matcher import KeywordMatcher
+
+# Optional: orjson serializes the KG in C, several times faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 
 # ============================================================================
@@ -222,19 +233,28 @@ EMPLOYMENT_KEYWORDS = [
 # MECHANISM/CONTEXT KEYWORDS
 # ============================================================================
 
-MECHANISM_KEYWORDS = {
+# Shared event-noun fragments for the mechanism and causal pattern tables
+_RATE_CUT_NOUN = r'rate cut|fed cut'
+_JOBS_REPORT_NOUN = r'jobs report|employment data'
+_JOBS_EVENT_NOUN = r'jobs report|employment'
+
+# Bounded lazy gap used by every pattern below: headlines are short, and an
+# unbounded .*? rescans the rest of every non-matching title
+_GAP = r'.{0,80}?'
+
+MECHANISM_KEYWORDS: Dict[str, Dict] = {
     # Expectation Timing - ENHANCED
     'ahead_of_jobs': {
         'id': 'mech:ahead_of_jobs_report',
         'name': 'Ahead of Jobs Report',
         'type': 'Expectation_Timing',
         'patterns': [
-            r'ahead of.*?(jobs report|employment data|nonfarm payrolls|nfp|unemployment)',
-            r'before.*?(jobs report|employment data|nonfarm payrolls|payroll)',
-            r'(awaits?|awaiting|eyes on).*?(jobs report|employment data|payroll)',
-            r'(jobs report|employment data|payroll).*(looms|on tap|in focus|due|expected)',
-            r'watch.*?(jobs report|employment data|payroll)',
-            r'ahead.*?(labor market|employment)',
+            rf'ahead of{_GAP}({_JOBS_REPORT_NOUN}|nonfarm payrolls|nfp|unemployment)',
+            rf'before{_GAP}({_JOBS_REPORT_NOUN}|nonfarm payrolls|payroll)',
+            rf'(awaits?|awaiting|eyes on){_GAP}({_JOBS_REPORT_NOUN}|payroll)',
+            rf'({_JOBS_REPORT_NOUN}|payroll).*(looms|on tap|in focus|due|expected)',
+            rf'watch{_GAP}({_JOBS_REPORT_NOUN}|payroll)',
+            rf'ahead{_GAP}(labor market|employment)',
         ]
     },
     'after_jobs': {
@@ -242,10 +262,10 @@ MECHANISM_KEYWORDS = {
         'name': 'After Jobs Report',
         'type': 'Expectation_Timing',
         'patterns': [
-            r'after.*?(jobs report|employment data|nonfarm payrolls|nfp)',
-            r'on.*?(jobs report|employment data|nonfarm payrolls)',
-            r'following.*?(jobs report|employment data|payroll)',
-            r'post-?(jobs report|employment)',
+            rf'after{_GAP}({_JOBS_REPORT_NOUN}|nonfarm payrolls|nfp)',
+            rf'on{_GAP}({_JOBS_REPORT_NOUN}|nonfarm payrolls)',
+            rf'following{_GAP}({_JOBS_REPORT_NOUN}|payroll)',
+            rf'post-?({_JOBS_EVENT_NOUN})',
         ]
     },
     
@@ -256,10 +276,10 @@ MECHANISM_KEYWORDS = {
         'type': 'Policy_Expectation',
         'patterns': [
             r'rate cut (hopes?|bets?|speculation|optimism|view|outlook|ideas|odds?)',
-            r'(hopes?|bets?|expects?|sees?|pins?)\s+(for|on).*?rate cut',
+            rf'(hopes?|bets?|expects?|sees?|pins?)\s+(for|on){_GAP}rate cut',
             r'rate cut expectations?',
-            r'(cut.*?chances?|chances?.*?cut)',
-            r'(trimmed?|pared?|cut|slash).*?rate (hike|increase)',
+            rf'(cut{_GAP}chances?|chances?{_GAP}cut)',
+            rf'(trimmed?|pared?|cut|slash){_GAP}rate (hike|increase)',
         ]
     },
     'rate_cut_fears': {
@@ -268,7 +288,7 @@ MECHANISM_KEYWORDS = {
         'type': 'Policy_Expectation',
         'patterns': [
             r'rate cut (doubts?|fears?|concerns?|skepticism|dim)',
-            r'(reduce|dim|fade).*?(cut.*?chances?|rate cut)',
+            rf'(reduce|dim|fade){_GAP}(cut{_GAP}chances?|rate cut)',
         ]
     },
     
@@ -280,7 +300,7 @@ MECHANISM_KEYWORDS = {
         'patterns': [
             r'rate hike (hopes?|bets?|odds?|expectations?)',
             r'hike (odds?|chances?|expectations?)',
-            r'(boost|raise|lift).*?(hike|tightening)',
+            rf'(boost|raise|lift){_GAP}(hike|tightening)',
         ]
     },
     
@@ -293,7 +313,7 @@ MECHANISM_KEYWORDS = {
             r'(sparks?|ignites?|fuels?|stokes?|renews?).*(inflation|rate hike|hike|tightening)',
             r'(cements?|keeps?|supports?|puts).*on.*hike (path|track)',
             r'hike (jitters|worries|concerns|fears)',
-            r'(reduce|dim|pare|fade).*(cut.*?chances?|cut.*?odds?)',
+            rf'(reduce|dim|pare|fade).*(cut{_GAP}chances?|cut{_GAP}odds?)',
             r'(keeps?|supports?|bolsters?).*hike',
         ]
     },
@@ -302,8 +322,8 @@ MECHANISM_KEYWORDS = {
         'name': 'Dovish Policy Repricing',
         'type': 'Policy_Repricing',
         'patterns': [
-            r'(boost|lift|raise|increase|sees?|spurs?).*(cut.*?chances?|cut.*?odds?|cut.*?bets)',
-            r'path to.*?cuts? (clearer|stronger)',
+            rf'(boost|lift|raise|increase|sees?|spurs?).*(cut{_GAP}chances?|cut{_GAP}odds?|cut{_GAP}bets)',
+            rf'path to{_GAP}cuts? (clearer|stronger)',
             r'(dovish|easing|accommodative).*(tone|tilt|pivot|shift)',
             r'(supports?|fuels?).*fed rate cut',
         ]
@@ -332,8 +352,8 @@ MECHANISM_KEYWORDS = {
             r'soft\s+(labor|labour)\s+market',
             r'cooling\s+(labor|labour)\s+market',
             r'(labor|labour)\s+market\s+(struggles?|woes|concerns)',
-            r'ebbing.*?momentum',
-            r'slowing.*?(labor|labour|hiring)',
+            rf'ebbing{_GAP}momentum',
+            rf'slowing{_GAP}(labor|labour|hiring)',
             r'(disappointing|dismal|gloomy)\s+(labor|labour|employment)',
         ]
     },
@@ -344,8 +364,8 @@ MECHANISM_KEYWORDS = {
         'name': 'Low Unemployment Rate',
         'type': 'Labor_State',
         'patterns': [
-            r'(unemployment|jobless).*?(falls?|drops?|declines?|hits?.*?(low|year|decade))',
-            r'(unemployment|jobless).*?(3\.[0-9]|4\.[0-9]|5\.[0-9])\%',
+            rf'(unemployment|jobless){_GAP}(falls?|drops?|declines?|hits?{_GAP}(low|year|decade))',
+            rf'(unemployment|jobless){_GAP}(3\.[0-9]|4\.[0-9]|5\.[0-9])\%',
         ]
     },
     'unemployment_high': {
@@ -353,8 +373,8 @@ MECHANISM_KEYWORDS = {
         'name': 'High Unemployment Rate',
         'type': 'Labor_State',
         'patterns': [
-            r'(unemployment|jobless).*?(rises?|climbs?|jumps?|hits?.*?(high|peak))',
-            r'(unemployment|jobless).*?(8\.|9\.|10\.|11\.)[0-9]\%',
+            rf'(unemployment|jobless){_GAP}(rises?|climbs?|jumps?|hits?{_GAP}(high|peak))',
+            rf'(unemployment|jobless){_GAP}(8\.|9\.|10\.|11\.)[0-9]\%',
         ]
     },
     
@@ -364,13 +384,17 @@ MECHANISM_KEYWORDS = {
         'name': 'Wage Pressure/Growth',
         'type': 'Macro_Channel',
         'patterns': [
-            r'wage(s)?.*?(growth|pressure|rise|increase|rise)',
-            r'(rising|strong).*?wage',
-            r'(pay|salary|compensation).*?(rise|increase)',
+            rf'wage(s)?{_GAP}(growth|pressure|rise|increase|rise)',
+            rf'(rising|strong){_GAP}wage',
+            rf'(pay|salary|compensation){_GAP}(rise|increase)',
         ]
     },
 }
 
+# Mechanism config by node ID ('mech:...'), for lookups from edges and nodes
+MECHANISM_BY_ID: Dict[str, Dict] = {m['id']: m for m in MECHANISM_KEYWORDS.values()}
+_MECH_NAME_BY_ID: Final[Dict[str, str]] = {m['id']: m['name'] for m in MECHANISM_KEYWORDS.values()}
+
 
 # ============================================================================
 # MOVEMENT INDICATORS
@@ -412,6 +436,19 @@ MOVEMENT_INDICATORS = {
     ]
 }
 
+# Direction labels, interned so edge and summary keys compare by identity
+POSITIVE: Final[str] = sys.intern('positive')
+NEGATIVE: Final[str] = sys.intern('negative')
+NEUTRAL: Final[str] = sys.intern('neutral')
+_POLARITY_LABELS: Final[Tuple[str, str, str]] = (POSITIVE, NEGATIVE, NEUTRAL)
+
+# KG edge relation labels, shared by every edge dict
+_REL_TRIGGERS: Final[str] = sys.intern('TRIGGERS')
+_REL_POS: Final[str] = sys.intern('POSITIVELY_IMPACTS')
+_REL_NEG: Final[str] = sys.intern('NEGATIVELY_IMPACTS')
+_REL_INDIRECT: Final[str] = sys.intern('INDIRECTLY_AFFECTS')
+_POLARITY_TO_RELATION: Final[Dict[str, str]] = {POSITIVE: _REL_POS, NEGATIVE: _REL_NEG}
+
 
 # ============================================================================
 # CAUSAL PATTERN DEFINITIONS
@@ -421,37 +458,37 @@ CAUSAL_PATTERNS = [
     # High Priority: Explicit Causal Language
     {
         'name': 'explicit_on_after',
-        'pattern': r'(on|after|following|amid)\s+.*?(rate cut|fed cut|jobs report|employment data|nonfarm payrolls)',
+        'pattern': rf'(on|after|following|amid)\s+{_GAP}({_RATE_CUT_NOUN}|{_JOBS_REPORT_NOUN}|nonfarm payrolls)',
         'requires_movement': True,
         'priority': 10
     },
     {
         'name': 'explicit_due_to',
-        'pattern': r'(due to|thanks to|because of|as a result of)\s+.*?(rate cut|fed cut|jobs report|employment)',
+        'pattern': rf'(due to|thanks to|because of|as a result of)\s+{_GAP}({_RATE_CUT_NOUN}|{_JOBS_EVENT_NOUN})',
         'requires_movement': True,
         'priority': 10
     },
     {
         'name': 'event_causes_asset',
-        'pattern': r'(rate cut|fed cut|jobs report|employment data)\s+(boosts?|sends?|drives?|pushes?|lifts?|supports?|weighs on|hurts?|hits?|pressures?)',
+        'pattern': rf'({_RATE_CUT_NOUN}|{_JOBS_REPORT_NOUN})\s+(boosts?|sends?|drives?|pushes?|lifts?|supports?|weighs on|hurts?|hits?|pressures?)',
         'priority': 10
     },
     
     # Medium-High Priority: Expectation/Anticipation Patterns
     {
         'name': 'movement_as_expectation',
-        'pattern': r'(as|while)\s+.*?(rate cut|jobs report|employment)\s+(hopes?|bets?|expectations?|optimism|speculation|doubts?|fears?)',
+        'pattern': rf'(as|while)\s+{_GAP}(rate cut|{_JOBS_EVENT_NOUN})\s+(hopes?|bets?|expectations?|optimism|speculation|doubts?|fears?)',
         'requires_movement': True,
         'priority': 9
     },
     {
         'name': 'event_quality_reaction',
-        'pattern': r'(strong|weak|disappointing|better|worse|blowout|dismal)\s+.*?(jobs report|employment).*?(send|lift|weigh|boost|hurt)\s+\w+\s+(higher|lower)',
+        'pattern': rf'(strong|weak|disappointing|better|worse|blowout|dismal)\s+{_GAP}({_JOBS_EVENT_NOUN}){_GAP}(send|lift|weigh|boost|hurt)\s+\w+\s+(higher|lower)',
         'priority': 8
     },
     {
         'name': 'movement_before',
-        'pattern': r'(before|ahead of|awaiting?|anticipating?)\s+.*?(rate cut|jobs report|employment data)',
+        'pattern': rf'(before|ahead of|awaiting?|anticipating?)\s+{_GAP}(rate cut|{_JOBS_REPORT_NOUN})',
         'requires_movement': True,
         'priority': 8
     },
@@ -459,12 +496,12 @@ CAUSAL_PATTERNS = [
     # Medium Priority: Contextual Patterns
     {
         'name': 'event_sends_direction',
-        'pattern': r'(rate cut|jobs report|employment)\s+(hopes?|bets?|data)?\s+(send|push|drive|lift)\s+\w+\s+(higher|lower|up|down)',
+        'pattern': rf'(rate cut|{_JOBS_EVENT_NOUN})\s+(hopes?|bets?|data)?\s+(send|push|drive|lift)\s+\w+\s+(higher|lower|up|down)',
         'priority': 7
     },
     {
         'name': 'asset_move_ahead_event',
-        'pattern': r'(stocks?|dollar|bond|gold|market|yen|euro|crude)\s+(rise|fall|rally|plunge|surge|slide).*?(ahead of|before|as|awaiting)\s+.*?(jobs report|employment|rate cut)',
+        'pattern': rf'(stocks?|dollar|bond|gold|market|yen|euro|crude)\s+(rise|fall|rally|plunge|surge|slide){_GAP}(ahead of|before|as|awaiting)\s+{_GAP}({_JOBS_EVENT_NOUN}|rate cut)',
         'priority': 7
     },
     {
@@ -474,182 +511,426 @@ CAUSAL_PATTERNS = [
     },
     {
         'name': 'direct_asset_event_link',
-        'pattern': r'(dollar|stocks?|bond|gold|yield|crude|yen)\s+(strength|weakness|gain|loss).*?(on|amid|after)\s+(rate cut|jobs report)',
+        'pattern': rf'(dollar|stocks?|bond|gold|yield|crude|yen)\s+(strength|weakness|gain|loss){_GAP}(on|amid|after)\s+(rate cut|jobs report)',
         'priority': 6
     },
 ]
 
 
 # ============================================================================
-# CORE EXTRACTION FUNCTIONS
+# COMPILED PATTERNS (built once at import)
 # ============================================================================
 
-def detect_event_type(text: str) -> Dict[str, bool]:
-    """
-    Detect which event types are mentioned in the text.
-    Returns dictionary with event type flags and state information.
-    """
-    text_lower = text.lower()
-    
-    events = {
-        'rate_cut': any(keyword in text_lower for keyword in RATE_CUT_KEYWORDS),
-        'rate_hike': any(keyword in text_lower for keyword in RATE_HIKE_KEYWORDS),
-        'employment': any(keyword in text_lower for keyword in EMPLOYMENT_KEYWORDS)
-    }
-    
-    return events
+# One alternation per mechanism: a single search answers
+# "does any of its patterns match?". Kept as parallel tuples in
+# MECHANISM_KEYWORDS order so the hot loop needs no dict lookups.
+_MECH_IDS: Final[Tuple[str, ...]] = tuple(sys.intern(mech_config['id']) for mech_config in MECHANISM_KEYWORDS.values())
+_MECH_COMPILED: Final[Tuple[re.Pattern, ...]] = tuple(
+    re.compile('|'.join(f'(?:{p})' for p in mech_config['patterns']))
+    for mech_config in MECHANISM_KEYWORDS.values()
+)
 
+# Every mechanism pattern contains at least one of these literals, so a
+# title with none of them cannot match any mechanism
+_MECHANISM_TRIGGER_RE: Final[re.Pattern] = re.compile(
+    'jobs report|employment|pay|nfp|labor|labour|cut|rate|hike|tightening|'
+    'inflation|dovish|easing|accommodative|full|hiring|momentum|jobless|'
+    'wage|salary|compensation',
+)
 
-def detect_mechanisms(text: str) -> Set[str]:
-    """
-    Detect mechanism/context nodes mentioned in the text.
-    Returns set of mechanism IDs.
-    """
-    detected = set()
-    
-    for mech_key, mech_config in MECHANISM_KEYWORDS.items():
-        for pattern in mech_config['patterns']:
-            if re.search(pattern, text, re.IGNORECASE):
-                detected.add(mech_config['id'])
-                break
-    
-    return detected
+# Causal patterns by descending priority, sorted once at import (stable, so
+# equal priorities keep their table order)
+_CAUSAL_SORTED: Final[Tuple[Dict, ...]] = tuple(sorted(CAUSAL_PATTERNS, key=lambda x: x['priority'], reverse=True))
 
+# Every causal pattern names one of these event nouns, so a title with none
+# of them goes straight to the fallback
+_CAUSAL_TRIGGER_RE: Final[re.Pattern] = re.compile(
+    f'{_RATE_CUT_NOUN}|{_JOBS_EVENT_NOUN}|nonfarm payrolls|rate hike|fed policy|monetary policy',
+)
 
-def detect_employment_strength(text: str) -> Optional[str]:
+
+def _priority_union(groups: Iterable[Tuple[str, str]]) -> re.Pattern:
     """
-    Detect whether employment data is characterized as strong/weak/mixed.
-    
-    Returns:
-        'strong', 'weak', 'mixed', or None
+    Compile (name, pattern) pairs, highest priority first, into one regex.
+    Each alternative is a lookahead from the start of the text, so the
+    first group that matches anywhere wins (a plain alternation would return
+    whichever pattern hits leftmost in the text instead); call .match and
+    read the winner's name from lastgroup.
     """
-    text_lower = text.lower()
-    
-    strong_indicators = [
+    return re.compile(
+        r'\A(?:' + '|'.join(f'(?=(?s:.*?)(?P<{name}>{pattern}))' for name, pattern in groups) + ')'
+    )
+
+
+# All causal patterns in one regex; the winning group name is the pattern
+_CAUSAL_UNION: Final[re.Pattern] = _priority_union(
+    (pattern_config['name'], pattern_config['pattern']) for pattern_config in _CAUSAL_SORTED
+)
+
+
+# Employment strength cues, checked strong > weak > mixed
+EMPLOYMENT_STRENGTH_INDICATORS = {
+    'strong': [
         'strong.*job', 'robust.*job', 'blowout.*job', 'solid.*job',
         'beat.*expect', 'exceed.*expect', 'better.*than.*expect',
         'surprise.*job', 'stunning.*job', 'crush', 'smashing'
-    ]
-    
-    weak_indicators = [
+    ],
+    'weak': [
         'weak.*job', 'soft.*job', 'tepid.*job', 'disappointing.*job',
         'dismal.*job', 'grim.*job', 'miss.*expect', 'below.*expect',
         'worse.*than.*expect', 'slump', 'faltered'
-    ]
-    
-    mixed_indicators = ['mixed.*job', 'mixed.*employment', 'mixed.*labor']
-    
-    if any(re.search(pattern, text_lower) for pattern in strong_indicators):
-        return 'strong'
-    elif any(re.search(pattern, text_lower) for pattern in weak_indicators):
-        return 'weak'
-    elif any(re.search(pattern, text_lower) for pattern in mixed_indicators):
-        return 'mixed'
-    
-    return None
+    ],
+    'mixed': ['mixed.*job', 'mixed.*employment', 'mixed.*labor'],
+}
+
+# The first strength whose cues appear anywhere wins
+_EMPLOYMENT_STRENGTH_RE: Final[re.Pattern] = _priority_union(
+    (strength, '|'.join(cues)) for strength, cues in EMPLOYMENT_STRENGTH_INDICATORS.items()
+)
+
+# Any event keyword (plain substrings, like _event_bits)
+_ANY_EVENT_RE: Final[re.Pattern] = re.compile('|'.join(
+    re.escape(kw) for kw in RATE_CUT_KEYWORDS + RATE_HIKE_KEYWORDS + EMPLOYMENT_KEYWORDS
+))
+
+# Event-class bits returned by _event_bits
+EVT_RATE_CUT: Final[int] = 1
+EVT_RATE_HIKE: Final[int] = 2
+EVT_EMPLOYMENT: Final[int] = 4
+
+# Event IDs by bit, in primary-event precedence order (the last one found
+# is the primary event)
+_EVENT_BITS: Final[Tuple[Tuple[str, int], ...]] = (
+    ('employment', EVT_EMPLOYMENT),
+    ('rate_cut', EVT_RATE_CUT),
+    ('rate_hike', EVT_RATE_HIKE),
+)
+
+# One literal alternation per event class: a search accepts exactly the
+# texts that any(kw in text) would
+_EVENT_TYPE_RES: Final[Tuple[Tuple[int, re.Pattern], ...]] = tuple(
+    (bit, re.compile('|'.join(re.escape(kw) for kw in keywords)))
+    for bit, keywords in (
+        (EVT_RATE_CUT, RATE_CUT_KEYWORDS),
+        (EVT_RATE_HIKE, RATE_HIKE_KEYWORDS),
+        (EVT_EMPLOYMENT, EMPLOYMENT_KEYWORDS),
+    )
+)
+
+# Asset-class words used by the employment heuristics (substring match, so
+# 'treasur' covers treasury/treasuries and 'bond' covers bonds). USD words
+# take precedence wherever they appear.
+_ASSET_CLASS_RE: Final[re.Pattern] = _priority_union((
+    ('usd', 'dollar|usd|greenback'),
+    ('safe_haven', 'bond|treasur|gold'),
+))
+
+# Movement indicators in one regex with a group per polarity. Indicators
+# must start on a word boundary ('up' no longer fires inside 'supply') but
+# may be inflected ('rise' still matches 'rises'). Negative comes first, so
+# a negative indicator anywhere beats a positive one. Neutral indicators
+# need no group: no match at all already means neutral.
+def _movement_words(polarity: str) -> str:
+    """
+    Escaped alternation of every indicator of one polarity, all strengths.
+    Repeats are dropped, as is any word another indicator is a prefix of:
+    with no trailing boundary, 'gain' already matches wherever 'gains' would.
+    """
+    words = dict.fromkeys(
+        word
+        for strength in (f'strong_{polarity}', polarity, f'weak_{polarity}')
+        for word in MOVEMENT_INDICATORS[strength]
+    )
+    return '|'.join(
+        re.escape(word)
+        for word in words
+        if not any(other != word and word.startswith(other) for other in words)
+    )
+
+
+_MOVEMENT_POLARITY_RE: Final[re.Pattern] = _priority_union(
+    (polarity, rf'\b(?:{_movement_words(polarity)})') for polarity in ('negative', 'positive')
+)
+
+# Group name -> the interned direction label it stands for
+_POLARITY_BY_GROUP: Final[Dict[str, str]] = {'negative': NEGATIVE, 'positive': POSITIVE}
+
+
+# Every asset keyword in one word-bounded scan
+_ASSET_MATCHER: Final[KeywordMatcher] = KeywordMatcher(ASSET_KEYWORDS)
 
 
 # ============================================================================
-# ASSET DETECTION
+# CORE EXTRACTION FUNCTIONS
 # ============================================================================
+# The _-prefixed detectors are the fast path: they take the title already
+# lowercased (once, in extract_multi_event_relations) and never lowercase it
+# again. Every pattern is lowercase, so none is compiled with IGNORECASE.
+# The public detectors further down accept text in any case.
 
-def detect_assets(text: str) -> Set[str]:
+def _event_bits(text_lower: str) -> int:
     """
-    Detect all asset types mentioned in the text.
-    Returns set of asset type identifiers.
+    Detect which event types are mentioned in the lowercased text.
+    Returns a bitfield of EVT_RATE_CUT, EVT_RATE_HIKE and EVT_EMPLOYMENT;
+    test a flag with `events & EVT_EMPLOYMENT`.
     """
-    detected = set()
-    
-    for asset_type, keywords in ASSET_KEYWORDS.items():
-        for keyword in keywords:
-            if re.search(r'\b' + re.escape(keyword) + r'\b', text, re.IGNORECASE):
-                detected.add(asset_type)
-                break
+    events = 0
+    for bit, event_re in _EVENT_TYPE_RES:
+        if event_re.search(text_lower):
+            events |= bit
     
-    return detected
+    return events
 
 
-def infer_direction_from_movement(text: str) -> str:
+def _detect_mechanisms(text_lower: str) -> FrozenSet[str]:
     """
-    Infer direction based on movement indicators in the text.
+    Detect mechanism/context nodes mentioned in the lowercased text.
+    Returns frozenset of mechanism IDs.
     """
-    # Check negative first (often more explicit)
-    for strength in ['strong_negative', 'negative', 'weak_negative']:
-        for indicator in MOVEMENT_INDICATORS[strength]:
-            if indicator in text:
-                return 'negative'
+    if not _MECHANISM_TRIGGER_RE.search(text_lower):
+        return frozenset()
     
-    # Check positive
-    for strength in ['strong_positive', 'positive', 'weak_positive']:
-        for indicator in MOVEMENT_INDICATORS[strength]:
-            if indicator in text:
-                return 'positive'
+    detected = set()
     
-    # Check neutral
-    for indicator in MOVEMENT_INDICATORS['neutral']:
-        if indicator in text:
-            return 'neutral'
+    for mech_id, mech_re in zip(_MECH_IDS, _MECH_COMPILED):
+        if mech_re.search(text_lower):
+            detected.add(mech_id)
     
-    return 'neutral'
+    return frozenset(detected)
 
 
-def infer_direction_with_context(text: str, event_type: str, 
-                                  employment_strength: Optional[str] = None,
-                                  mechanisms: Set[str] = None) -> str:
+def _employment_strength(text_lower: str) -> Optional[str]:
+    """Return 'strong', 'weak', 'mixed' or None for the lowercased text."""
+    match = _EMPLOYMENT_STRENGTH_RE.match(text_lower)
+    if match:
+        return match.lastgroup
+    
+    return None
+
+
+def _detect_assets(text_lower: str) -> FrozenSet[str]:
     """
-    Infer direction considering event type and mechanisms.
+    Detect all asset types mentioned in the lowercased text.
+    Returns frozenset of asset type identifiers.
+    """
+    # One scan over all keywords instead of one regex per keyword
+    return frozenset(_ASSET_MATCHER.find(text_lower))
+
+
+def _movement_direction(text_lower: str) -> str:
+    """Infer direction from the movement indicators in the lowercased text."""
+    # Negative wins over positive (often more explicit)
+    match = _MOVEMENT_POLARITY_RE.match(text_lower)
+    if match and match.lastgroup:
+        return _POLARITY_BY_GROUP[match.lastgroup]
+    
+    # Neutral indicators and no indicator at all both mean neutral
+    return NEUTRAL
+
+
+def _asset_class(text_lower: str) -> Optional[str]:
+    """Return 'usd', 'safe_haven' or None for the asset words in the text."""
+    match = _ASSET_CLASS_RE.match(text_lower)
+    return match.lastgroup if match else None
+
+
+def _context_direction(text_lower: str, event_type: str, employment_strength: Optional[str],
+                       mechanisms: AbstractSet[str], base_direction: str) -> str:
+    """
+    Adjust base_direction, the _movement_direction of the lowercased text,
+    for the event type and mechanisms.
     
     Employment heuristics:
     - Weak jobs + rate cut bets â†’ dovish â†’ USD down, bonds up, gold up, stocks mixed-positive
     - Strong jobs + hike worries â†’ hawkish â†’ USD up, bonds down, gold down, stocks mixed-negative
     """
-    # Start with movement-based direction
-    base_direction = infer_direction_from_movement(text)
-    
-    if mechanisms is None:
-        mechanisms = set()
-    
     # Adjust based on employment strength and mechanisms
     if event_type == 'employment' and employment_strength:
         if employment_strength == 'weak':
             if 'mech:rate_cut_bets' in mechanisms or 'mech:dovish_repricing' in mechanisms:
                 # Weak jobs + dovish â†’ generally positive for bonds/gold, negative for USD
-                if any(word in text.lower() for word in ['dollar', 'usd', 'greenback']):
-                    return 'negative'
-                elif any(word in text.lower() for word in ['bond', 'treasur', 'gold']):
-                    return 'positive'
+                asset_class = _asset_class(text_lower)
+                if asset_class == 'usd':
+                    return NEGATIVE
+                elif asset_class == 'safe_haven':
+                    return POSITIVE
         
         elif employment_strength == 'strong':
             if 'mech:rate_hike_worries' in mechanisms or 'mech:hawkish_repricing' in mechanisms:
                 # Strong jobs + hawkish â†’ generally positive for USD, negative for bonds/gold
-                if any(word in text.lower() for word in ['dollar', 'usd', 'greenback']):
-                    return 'positive'
-                elif any(word in text.lower() for word in ['bond', 'treasur', 'gold']):
-                    return 'negative'
+                asset_class = _asset_class(text_lower)
+                if asset_class == 'usd':
+                    return POSITIVE
+                elif asset_class == 'safe_haven':
+                    return NEGATIVE
     
     return base_direction
 
 
-def match_causal_pattern(text: str, asset_type: str) -> Optional[Tuple[str, str]]:
+def _causal_match(text_lower: str, movement_direction: str) -> Tuple[str, str]:
     """
-    Match causal patterns in the text for a given asset.
-    Returns (pattern_name, direction) or None.
+    Match causal patterns in the lowercased text.
+    Returns (pattern_name, movement_direction); 'general_context' when no
+    pattern matches. Patterns don't depend on the asset, so one result
+    serves every asset in the headline.
     """
-    sorted_patterns = sorted(CAUSAL_PATTERNS, key=lambda x: x['priority'], reverse=True)
-    
-    for pattern_config in sorted_patterns:
-        if re.search(pattern_config['pattern'], text, re.IGNORECASE):
-            direction = infer_direction_from_movement(text)
-            return (pattern_config['name'], direction)
+    if _CAUSAL_TRIGGER_RE.search(text_lower):
+        match = _CAUSAL_UNION.match(text_lower)
+        if match and match.lastgroup:
+            return (match.lastgroup, movement_direction)
     
     # Fallback
-    return ('general_context', infer_direction_from_movement(text))
+    return ('general_context', movement_direction)
 
 
-def extract_multi_event_relations(titles: List[str], df: pd.DataFrame = None) -> Dict:
+# ============================================================================
+# PUBLIC DETECTORS
+# ============================================================================
+# Same results as the fast path above for text in any case
+
+def detect_event_type(text: str) -> Dict[str, bool]:
+    """
+    Detect which event types are mentioned in the text.
+    Returns dictionary with event type flags.
+    """
+    events = _event_bits(text.lower())
+    return {
+        'rate_cut': bool(events & EVT_RATE_CUT),
+        'rate_hike': bool(events & EVT_RATE_HIKE),
+        'employment': bool(events & EVT_EMPLOYMENT),
+    }
+
+
+def detect_mechanisms(text: str) -> Set[str]:
+    """
+    Detect mechanism/context nodes mentioned in the text.
+    Returns set of mechanism IDs.
+    """
+    return set(_detect_mechanisms(text.lower()))
+
+
+def detect_employment_strength(text: str) -> Optional[str]:
+    """
+    Detect whether employment data is characterized as strong/weak/mixed.
+    
+    Returns:
+        'strong', 'weak', 'mixed', or None
+    """
+    return _employment_strength(text.lower())
+
+
+def detect_assets(text: str) -> Set[str]:
+    """
+    Detect all asset types mentioned in the text.
+    Returns set of asset type identifiers.
+    """
+    return set(_detect_assets(text.lower()))
+
+
+def infer_direction_from_movement(text: str) -> str:
+    """
+    Infer direction based on movement indicators in the text.
+    """
+    return _movement_direction(text.lower())
+
+
+def infer_direction_with_context(text: str, event_type: str, 
+                                  employment_strength: Optional[str] = None,
+                                  mechanisms: Optional[AbstractSet[str]] = None) -> str:
+    """
+    Infer direction considering event type and mechanisms.
+    See _context_direction for the employment heuristics.
+    """
+    text_lower = text.lower()
+    return _context_direction(
+        text_lower, event_type, employment_strength, mechanisms or frozenset(),
+        _movement_direction(text_lower)
+    )
+
+
+def match_causal_pattern(text: str, asset_type: Optional[str] = None) -> Tuple[str, str]:
+    """
+    Match causal patterns in the text for a given asset.
+    Returns (pattern_name, direction); 'general_context' if none matches.
+    Patterns are matched on the text alone, so the asset may be omitted.
+    """
+    text_lower = text.lower()
+    return _causal_match(text_lower, _movement_direction(text_lower))
+
+
+# Edge tuples built by extract_multi_event_relations, and their field order
+# (date and url are None when the source frame has no such column)
+EventEdge = Tuple[str, str, str, str, str, str, Optional[str], Optional[str]]
+MechanismEdge = Tuple[str, str, str, str, str, Optional[str], Optional[str]]
+EVENT_EDGE_FIELDS: Final[List[str]] = ['event', 'target', 'target_type', 'direction', 'title', 'pattern', 'date', 'url']
+MECHANISM_EDGE_FIELDS: Final[List[str]] = ['mechanism', 'asset', 'direction', 'title', 'pattern', 'date', 'url']
+
+
+@lru_cache(maxsize=65536)
+def _analyze_title(title_lower: str) -> Optional[tuple]:
+    """
+    Run every detector over one lowercased headline.
+    
+    Returns None if the headline has no event or no asset, else
+    (events, primary_event, mechanisms, assets, direction, causal_match),
+    with mechanisms and assets as sorted tuples.
+    Cached, so a headline repeated across the corpus is scanned only once;
+    this is the only cache, as each detector runs once per title in here.
+    """
+    event_types = _event_bits(title_lower)
+    # Same precedence as before: the last event found is the primary one
+    events = tuple(event for event, bit in _EVENT_BITS if event_types & bit)
+    if not events:
+        return None
+    
+    # Detect mechanisms and assets
+    mechanisms = _detect_mechanisms(title_lower)
+    assets = _detect_assets(title_lower)
+    if not assets:
+        return None
+    
+    # Employment strength feeds the context-aware direction inference
+    employment_strength = None
+    if event_types & EVT_EMPLOYMENT:
+        employment_strength = _employment_strength(title_lower)
+    
+    # Movement words are scanned once and shared by both direction consumers
+    movement_direction = _movement_direction(title_lower)
+    
+    event_type_for_context = 'employment' if event_types & EVT_EMPLOYMENT else 'monetary_policy'
+    direction = _context_direction(
+        title_lower, event_type_for_context, employment_strength, mechanisms, movement_direction
+    )
+    
+    # Causal patterns don't depend on the asset: match once per title
+    causal_match = _causal_match(title_lower, movement_direction)
+    
+    # Sorted, so edges come out in the same order whether this ran here or
+    # in a worker process (set order does not survive pickling)
+    return (events, events[-1], tuple(sorted(mechanisms)), tuple(sorted(assets)), direction, causal_match)
+
+
+def _column_values(df: Optional[pd.DataFrame], column: str, length: int) -> list:
+    """Column values as a list of `length` items, with nulls and padding as None."""
+    if df is None or column not in df.columns:
+        return [None] * length
+    # Nulls are masked once here so edge consumers never need pd.notna
+    col = df[column]
+    values = col.astype(object).where(col.notna(), None).tolist()[:length]
+    return values + [None] * (length - len(values))
+
+
+def extract_multi_event_relations(titles: List[str], df: Optional[pd.DataFrame] = None,
+                                  n_jobs: int = 1) -> Dict:
     """
     Extract causal relationships from news headlines with multi-event support.
     
+    Args:
+        titles: Headlines to analyze
+        df: Source frame supplying the Date and Url columns, if any
+        n_jobs: Worker processes for headline analysis; 1 (default) runs
+            in-process, N > 1 uses N workers, -1 uses one worker per CPU
+    
     Returns:
         Dictionary containing:
         - events: Set of event nodes
@@ -658,75 +939,68 @@ def extract_multi_event_relations(titles: List[str], df: pd.DataFrame = None) ->
         - event_edges: List of (event, mechanism/asset, ...) tuples
         - mechanism_edges: List of (mechanism, asset, ...) tuples
     """
-    relations = {
+    if n_jobs != -1 and n_jobs < 1:
+        raise ValueError(f"n_jobs must be -1 or a positive integer, got {n_jobs!r}")
+    
+    relations: Dict[str, Any] = {
         'events': set(),
         'mechanisms': set(),
         'assets': set(),
         'event_edges': [],  # Event -> Mechanism or Event -> Asset
         'mechanism_edges': [],  # Mechanism -> Asset
     }
-    
-    for idx, title in enumerate(titles):
-        title_lower = title.lower()
-        
-        # Detect events
-        event_types = detect_event_type(title_lower)
-        if not any(event_types.values()):
+    event_edges: List[EventEdge] = relations['event_edges']
+    mechanism_edges: List[MechanismEdge] = relations['mechanism_edges']
+    
+    # Lowercase and find event headlines in one vectorized pass; the loop
+    # below only visits titles that mention at least one event
+    titles = list(titles)
+    lowered = pd.Series(titles, dtype=object).str.lower()
+    has_event = lowered.str.contains(_ANY_EVENT_RE, na=False).to_numpy()
+    titles_lower: List[str] = lowered.tolist()
+    
+    # Metadata columns pulled out once instead of a row lookup per title
+    dates = _column_values(df, 'Date', len(titles))
+    urls = _column_values(df, 'Url', len(titles))
+    
+    event_indices = has_event.nonzero()[0]
+    analyze: Callable[[str], Optional[tuple]]
+    if n_jobs == 1:
+        analyze = _analyze_title
+    else:
+        # Detectors are pure functions of the title, so each distinct event
+        # title is analyzed once across a process pool; workers compile the
+        # matchers on import
+        unique_titles = list(dict.fromkeys(titles_lower[idx] for idx in event_indices))
+        with ProcessPoolExecutor(max_workers=None if n_jobs == -1 else n_jobs) as pool:
+            analyses = pool.map(_analyze_title, unique_titles, chunksize=256)
+            analyze = dict(zip(unique_titles, analyses)).__getitem__
+    
+    for idx in event_indices:
+        analysis = analyze(titles_lower[idx])
+        if analysis is None:
             continue
+        events, primary_event, mechanisms, assets, direction, result = analysis
         
-        # Extract metadata
-        date = None
-        url = None
-        if df is not None:
-            try:
-                date = df.iloc[idx].get('Date')
-                url = df.iloc[idx].get('Url')
-            except:
-                pass
-        
-        # Detect mechanisms and assets
-        mechanisms = detect_mechanisms(title_lower)
-        assets = detect_assets(title_lower)
-        
-        if not assets:
-            continue
-        
-        # Track employment strength for context-aware direction inference
-        employment_strength = None
-        primary_event = None
-        
-        if event_types['employment']:
-            employment_strength = detect_employment_strength(title_lower)
-            primary_event = 'employment'
-            relations['events'].add('employment')
-        
-        if event_types['rate_cut']:
-            primary_event = 'rate_cut'
-            relations['events'].add('rate_cut')
-        
-        if event_types['rate_hike']:
-            primary_event = 'rate_hike'
-            relations['events'].add('rate_hike')
+        title = titles[idx]
+        # Stringified once per title; every edge from it shares the str
+        date = dates[idx]
+        date = str(date) if date else None
+        url = urls[idx]
         
         # Add to sets
+        relations['events'].update(events)
         relations['mechanisms'].update(mechanisms)
         relations['assets'].update(assets)
         
-        # Build edges with improved direction inference
-        event_type_for_context = 'employment' if event_types['employment'] else 'monetary_policy'
-        direction = infer_direction_with_context(
-            title_lower, event_type_for_context, employment_strength, mechanisms
-        )
-        
         for asset in assets:
             if mechanisms:
                 # Path: Event -> Mechanism -> Asset
                 for mechanism in mechanisms:
                     # Event -> Mechanism edge
-                    result = match_causal_pattern(title_lower, asset)
                     pattern_name = result[0] if result else 'general_context'
                     
-                    relations['event_edges'].append((
+                    event_edges.append((
                         primary_event,
                         mechanism,
                         'mechanism',
@@ -738,7 +1012,7 @@ def extract_multi_event_relations(titles: List[str], df: pd.DataFrame = None) ->
                     ))
                     
                     # Mechanism -> Asset edges
-                    relations['mechanism_edges'].append((
+                    mechanism_edges.append((
                         mechanism,
                         asset,
                         direction,
@@ -749,13 +1023,12 @@ def extract_multi_event_relations(titles: List[str], df: pd.DataFrame = None) ->
                     ))
             else:
                 # Direct path: Event -> Asset
-                result = match_causal_pattern(title_lower, asset)
                 if result:
                     pattern_name, inferred_direction = result
                     # Use context-aware direction if available, otherwise use pattern-inferred
-                    final_direction = direction if direction != 'neutral' else inferred_direction
+                    final_direction = direction if direction != NEUTRAL else inferred_direction
                     
-                    relations['event_edges'].append((
+                    event_edges.append((
                         primary_event,
                         asset,
                         'asset',
@@ -773,58 +1046,85 @@ def extract_multi_event_relations(titles: List[str], df: pd.DataFrame = None) ->
 # SUMMARY AND ANALYSIS FUNCTIONS
 # ============================================================================
 
+def _new_event_summary() -> Dict:
+    """Empty summary entry for one event."""
+    return {
+        'total_mentions': 0,
+        'mechanisms': defaultdict(int),
+        'assets': defaultdict(int),
+        'positive': 0,
+        'negative': 0,
+        'neutral': 0
+    }
+
+
+def _new_mechanism_summary() -> Dict:
+    """Empty summary entry for one mechanism."""
+    return {
+        'total_mentions': 0,
+        'assets': defaultdict(int),
+        'polarity': defaultdict(int),
+    }
+
+
+def _new_asset_summary() -> Dict:
+    """Empty summary entry for one asset."""
+    return {
+        'positive': 0,
+        'negative': 0,
+        'neutral': 0,
+        'total': 0,
+        'events': defaultdict(int),
+        'mechanisms': defaultdict(int),
+    }
+
+
 def summarize_relations(relations: Dict) -> Dict:
     """
     Create comprehensive summary of relationships.
     """
-    summary = {
-        'by_event': defaultdict(lambda: {
-            'total_mentions': 0,
-            'mechanisms': defaultdict(int),
-            'assets': defaultdict(int),
-            'positive': 0,
-            'negative': 0,
-            'neutral': 0
-        }),
-        'by_mechanism': defaultdict(lambda: {
-            'total_mentions': 0,
-            'assets': defaultdict(int),
-            'polarity': defaultdict(int),
-        }),
-        'by_asset': defaultdict(lambda: {
-            'positive': 0,
-            'negative': 0,
-            'neutral': 0,
-            'total': 0,
-            'events': defaultdict(int),
-            'mechanisms': defaultdict(int),
-        }),
+    summary: Dict[str, DefaultDict[str, Dict]] = {
+        'by_event': defaultdict(_new_event_summary),
+        'by_mechanism': defaultdict(_new_mechanism_summary),
+        'by_asset': defaultdict(_new_asset_summary),
     }
     
+    by_event = summary['by_event']
+    by_mechanism = summary['by_mechanism']
+    by_asset = summary['by_asset']
+    
+    # Edges repeat the same few keys, so each distinct key is counted once
+    # (Counter tallies in C) and folded into the nested summary once; keys
+    # keep their first-appearance order
+    event_counts = Counter(edge[:4] for edge in relations['event_edges'])
+    mechanism_counts = Counter(edge[:3] for edge in relations['mechanism_edges'])
+    
     # Summarize event edges
-    for edge in relations['event_edges']:
-        event, target, target_type, direction, title, pattern, date, url = edge
-        summary['by_event'][event]['total_mentions'] += 1
-        summary['by_event'][event][direction] += 1
+    for (event, target, target_type, direction), count in event_counts.items():
+        event_summary = by_event[event]
+        event_summary['total_mentions'] += count
+        event_summary[direction] += count
         
         if target_type == 'mechanism':
-            summary['by_event'][event]['mechanisms'][target] += 1
+            event_summary['mechanisms'][target] += count
         else:  # asset
-            summary['by_event'][event]['assets'][target] += 1
-            summary['by_asset'][target][direction] += 1
-            summary['by_asset'][target]['total'] += 1
-            summary['by_asset'][target]['events'][event] += 1
+            event_summary['assets'][target] += count
+            asset_summary = by_asset[target]
+            asset_summary[direction] += count
+            asset_summary['total'] += count
+            asset_summary['events'][event] += count
     
     # Summarize mechanism edges
-    for edge in relations['mechanism_edges']:
-        mechanism, asset, direction, title, pattern, date, url = edge
-        summary['by_mechanism'][mechanism]['total_mentions'] += 1
-        summary['by_mechanism'][mechanism]['assets'][asset] += 1
-        summary['by_mechanism'][mechanism]['polarity'][direction] += 1
+    for (mechanism, asset, direction), count in mechanism_counts.items():
+        mechanism_summary = by_mechanism[mechanism]
+        mechanism_summary['total_mentions'] += count
+        mechanism_summary['assets'][asset] += count
+        mechanism_summary['polarity'][direction] += count
         
-        summary['by_asset'][asset][direction] += 1
-        summary['by_asset'][asset]['total'] += 1
-        summary['by_asset'][asset]['mechanisms'][mechanism] += 1
+        asset_summary = by_asset[asset]
+        asset_summary[direction] += count
+        asset_summary['total'] += count
+        asset_summary['mechanisms'][mechanism] += count
     
     return summary
 
@@ -860,7 +1160,7 @@ def print_extraction_results(relations: Dict, summary: Dict):
     print("=" * 100)
     sorted_mechs = sorted(summary['by_mechanism'].items(), key=lambda x: x[1]['total_mentions'], reverse=True)[:10]
     for mech, data in sorted_mechs:
-        mech_name = next((m['name'] for m in MECHANISM_KEYWORDS.values() if m['id'] == mech), mech)
+        mech_name = _MECH_NAME_BY_ID.get(mech, mech)
         print(f"\n{mech_name} ({mech})")
         print(f"  Mentions: {data['total_mentions']}")
         print(f"  Polarity: {dict(data['polarity'])}")
@@ -897,29 +1197,102 @@ def print_extraction_results(relations: Dict, summary: Dict):
 # JSON EXPORT FUNCTIONS
 # ============================================================================
 
-def build_multi_event_knowledge_graph(relations: Dict, summary: Dict) -> Dict:
+# Evidence entries kept per KG edge; the full count is still reported
+_MAX_EDGE_EVIDENCE: Final[int] = 10
+
+
+class _EdgeGroup:
+    """Evidence and pattern counts accumulated for one KG edge."""
+    __slots__ = ('polarity', 'evidence', 'evidence_count', 'patterns', 'max_count', 'max_pattern')
+    
+    def __init__(self) -> None:
+        # Groups are only created to add() to, which sets this
+        self.polarity: str = NEUTRAL
+        self.evidence: List[Dict] = []
+        self.evidence_count = 0
+        self.patterns: Dict[str, int] = {}
+        self.max_count = 0
+        self.max_pattern: Optional[str] = None
+    
+    def add(self, direction: str, title: str, pattern: str, date: Optional[str], url: Optional[str]) -> None:
+        """Record one edge tuple, keeping only the first few evidence entries."""
+        # The latest edge's direction wins
+        self.polarity = direction
+        self.evidence_count += 1
+        if self.evidence_count <= _MAX_EDGE_EVIDENCE:
+            self.evidence.append({
+                'title': title,
+                'date': date,
+                'url': url or None,
+                'pattern': pattern
+            })
+        self.count_pattern(pattern)
+    
+    def count_pattern(self, pattern: str) -> None:
+        """Count one pattern hit and keep the most common pattern current."""
+        patterns = self.patterns
+        count = patterns.get(pattern, 0) + 1
+        patterns[pattern] = count
+        if count > self.max_count:
+            self.max_count = count
+            self.max_pattern = pattern
+        elif count == self.max_count and pattern != self.max_pattern:
+            # On a tie the pattern seen first wins, as max() over the dict did
+            leader = self.max_pattern
+            if next(p for p in patterns if p == pattern or p == leader) == pattern:
+                self.max_pattern = pattern
+
+
+def _edge_groups(relations: Dict) -> Tuple[Dict[Tuple[str, str, str], _EdgeGroup],
+                                          Dict[Tuple[str, str], _EdgeGroup]]:
     """
-    Build a structured JSON knowledge graph with 5-layer architecture.
+    Accumulate the edge tuples into one _EdgeGroup per KG edge, in a single
+    pass over each list. Returns (event groups keyed by (event, target,
+    target_type), mechanism groups keyed by (mechanism, asset)), each in
+    order of first appearance.
     """
-    timestamp = datetime.utcnow().isoformat() + 'Z'
-    
-    kg = {
-        "metadata": {
-            "created_at": timestamp,
-            "source": "Multi-event financial news headline extraction",
-            "event_types": ["Monetary Policy", "Labor Market"],
-            "extraction_method": "Rule-based pattern matching with mechanism layer",
-            "architecture": "5-layer: Provenance -> Event -> Mechanism -> Asset -> Outcome",
-            "total_nodes": 0,
-            "total_edges": 0,
-            "description": (
-                "Multi-event causal knowledge graph extracted from financial news headlines "
-                "covering US rate cuts and employment data, with explicit mechanism/context layer"
-            )
-        },
-        "nodes": [],
-        "edges": []
+    event_groups: Dict[Tuple[str, str, str], _EdgeGroup] = {}
+    for event, target, target_type, direction, title, pattern, date, url in relations['event_edges']:
+        key = (event, target, target_type)
+        group = event_groups.get(key)
+        if group is None:
+            group = event_groups[key] = _EdgeGroup()
+        group.add(direction, title, pattern, date, url)
+    
+    mechanism_groups: Dict[Tuple[str, str], _EdgeGroup] = {}
+    for mechanism, asset, direction, title, pattern, date, url in relations['mechanism_edges']:
+        pair = (mechanism, asset)
+        group = mechanism_groups.get(pair)
+        if group is None:
+            group = mechanism_groups[pair] = _EdgeGroup()
+        group.add(direction, title, pattern, date, url)
+    
+    return event_groups, mechanism_groups
+
+
+def _kg_metadata(timestamp: str) -> Dict:
+    """KG metadata block; node and edge totals are filled in once known."""
+    return {
+        "created_at": timestamp,
+        "source": "Multi-event financial news headline extraction",
+        "event_types": ["Monetary Policy", "Labor Market"],
+        "extraction_method": "Rule-based pattern matching with mechanism layer",
+        "architecture": "5-layer: Provenance -> Event -> Mechanism -> Asset -> Outcome",
+        "total_nodes": 0,
+        "total_edges": 0,
+        "description": (
+            "Multi-event causal knowledge graph extracted from financial news headlines "
+            "covering US rate cuts and employment data, with explicit mechanism/context layer"
+        )
     }
+
+
+def _kg_nodes(relations: Dict, summary: Dict, timestamp: str):
+    """Yield the event, mechanism and asset nodes of the KG in layer order."""
+    # Each node gets its own copy of one of these, so a caller editing one
+    # node's provenance does not change every other node
+    provenance_headlines = {"source": "News headlines", "created_at": timestamp}
+    provenance_derived = {"source": "Derived from headlines", "created_at": timestamp}
     
     # Layer 1: Event Nodes
     event_display = {
@@ -937,16 +1310,13 @@ def build_multi_event_knowledge_graph(relations: Dict, summary: Dict) -> Dict:
                 "event_class": event_id,
                 "mention_count": summary['by_event'][event_id]['total_mentions']
             },
-            "provenance": {
-                "source": "News headlines",
-                "created_at": timestamp
-            }
+            "provenance": dict(provenance_headlines)
         }
-        kg["nodes"].append(event_node)
+        yield event_node
     
     # Layer 2: Mechanism Nodes
     for mech_id in sorted(relations['mechanisms']):
-        mech_config = next((m for m in MECHANISM_KEYWORDS.values() if m['id'] == mech_id), None)
+        mech_config = MECHANISM_BY_ID.get(mech_id)
         if not mech_config:
             continue
         
@@ -968,12 +1338,9 @@ def build_multi_event_knowledge_graph(relations: Dict, summary: Dict) -> Dict:
                 "negative_mentions": mech_data['polarity'].get('negative', 0),
                 "neutral_mentions": mech_data['polarity'].get('neutral', 0),
             },
-            "provenance": {
-                "source": "Derived from headlines",
-                "created_at": timestamp
-            }
+            "provenance": dict(provenance_derived)
         }
-        kg["nodes"].append(mech_node)
+        yield mech_node
     
     # Layer 3: Asset Nodes
     for asset_id in sorted(relations['assets']):
@@ -983,12 +1350,10 @@ def build_multi_event_knowledge_graph(relations: Dict, summary: Dict) -> Dict:
         neg = asset_data['negative']
         neu = asset_data['neutral']
         
-        if pos > neg and pos > neu:
-            dominant = "positive"
-        elif neg > pos and neg > neu:
-            dominant = "negative"
-        else:
-            dominant = "neutral"
+        # A strict maximum picks its label; any tie for the top count is neutral
+        counts = (pos, neg, neu)
+        top = max(counts)
+        dominant = _POLARITY_LABELS[counts.index(top)] if counts.count(top) == 1 else NEUTRAL
         
         asset_node = {
             "id": f"asset:{asset_id}",
@@ -1006,47 +1371,27 @@ def build_multi_event_knowledge_graph(relations: Dict, summary: Dict) -> Dict:
                 "neutral_mentions": neu,
                 "total_mentions": asset_data['total']
             },
-            "provenance": {
-                "source": "Derived from headlines",
-                "created_at": timestamp
-            }
+            "provenance": dict(provenance_derived)
         }
-        kg["nodes"].append(asset_node)
+        yield asset_node
     
-    # Build Edges
+
+
+def _kg_edges(event_groups: Dict[Tuple[str, str, str], _EdgeGroup],
+              mechanism_groups: Dict[Tuple[str, str], _EdgeGroup], timestamp: str):
+    """
+    Yield the causal edges of the KG from the _edge_groups result, numbered
+    in emission order.
+    """
     edge_id = 1
     
     # Event -> Mechanism and Event -> Asset edges
-    event_edge_groups = defaultdict(lambda: {
-        'target_type': None,
-        'polarity': None,
-        'evidence': [],
-        'patterns': defaultdict(int)
-    })
-    
-    for edge in relations['event_edges']:
-        event, target, target_type, direction, title, pattern, date, url = edge
-        key = (event, target, target_type)
-        event_edge_groups[key]['target_type'] = target_type
-        event_edge_groups[key]['polarity'] = direction
-        event_edge_groups[key]['evidence'].append({
-            'title': title,
-            'date': str(date) if date and pd.notna(date) else None,
-            'url': url if url and pd.notna(url) else None,
-            'pattern': pattern
-        })
-        event_edge_groups[key]['patterns'][pattern] += 1
-    
-    for (event, target, target_type), data in event_edge_groups.items():
-        evidence_count = len(data['evidence'])
-        most_common_pattern = max(data['patterns'].items(), key=lambda x: x[1])[0]
-        
+    for (event, target, target_type), data in event_groups.items():
         if target_type == 'mechanism':
-            relation = 'TRIGGERS'
+            relation = _REL_TRIGGERS
             target_id = target
         else:  # asset
-            relation = 'POSITIVELY_IMPACTS' if data['polarity'] == 'positive' else \
-                       'NEGATIVELY_IMPACTS' if data['polarity'] == 'negative' else 'INDIRECTLY_AFFECTS'
+            relation = _POLARITY_TO_RELATION.get(data.polarity, _REL_INDIRECT)
             target_id = f"asset:{target}"
         
         edge = {
@@ -1055,41 +1400,19 @@ def build_multi_event_knowledge_graph(relations: Dict, summary: Dict) -> Dict:
             "source": f"event:{event}",
             "target": target_id,
             "relation": relation,
-            "polarity": data['polarity'],
-            "evidence_count": evidence_count,
-            "primary_pattern": most_common_pattern,
-            "pattern_distribution": dict(data['patterns']),
-            "evidence": data['evidence'][:10],
+            "polarity": data.polarity,
+            "evidence_count": data.evidence_count,
+            "primary_pattern": data.max_pattern,
+            "pattern_distribution": data.patterns,
+            "evidence": data.evidence,
             "last_updated": timestamp,
         }
-        kg["edges"].append(edge)
+        yield edge
         edge_id += 1
     
     # Mechanism -> Asset edges
-    mech_edge_groups = defaultdict(lambda: {
-        'polarity': None,
-        'evidence': [],
-        'patterns': defaultdict(int)
-    })
-    
-    for edge in relations['mechanism_edges']:
-        mechanism, asset, direction, title, pattern, date, url = edge
-        key = (mechanism, asset)
-        mech_edge_groups[key]['polarity'] = direction
-        mech_edge_groups[key]['evidence'].append({
-            'title': title,
-            'date': str(date) if date and pd.notna(date) else None,
-            'url': url if url and pd.notna(url) else None,
-            'pattern': pattern
-        })
-        mech_edge_groups[key]['patterns'][pattern] += 1
-    
-    for (mechanism, asset), data in mech_edge_groups.items():
-        evidence_count = len(data['evidence'])
-        most_common_pattern = max(data['patterns'].items(), key=lambda x: x[1])[0]
-        
-        relation = 'POSITIVELY_IMPACTS' if data['polarity'] == 'positive' else \
-                   'NEGATIVELY_IMPACTS' if data['polarity'] == 'negative' else 'INDIRECTLY_AFFECTS'
+    for (mechanism, asset), data in mechanism_groups.items():
+        relation = _POLARITY_TO_RELATION.get(data.polarity, _REL_INDIRECT)
         
         edge = {
             "id": f"edge:e{edge_id}",
@@ -1097,15 +1420,29 @@ def build_multi_event_knowledge_graph(relations: Dict, summary: Dict) -> Dict:
             "source": mechanism,
             "target": f"asset:{asset}",
             "relation": relation,
-            "polarity": data['polarity'],
-            "evidence_count": evidence_count,
-            "primary_pattern": most_common_pattern,
-            "pattern_distribution": dict(data['patterns']),
-            "evidence": data['evidence'][:10],
+            "polarity": data.polarity,
+            "evidence_count": data.evidence_count,
+            "primary_pattern": data.max_pattern,
+            "pattern_distribution": data.patterns,
+            "evidence": data.evidence,
             "last_updated": timestamp,
         }
-        kg["edges"].append(edge)
+        yield edge
         edge_id += 1
+
+
+def build_multi_event_knowledge_graph(relations: Dict, summary: Dict) -> Dict:
+    """
+    Build a structured JSON knowledge graph with 5-layer architecture.
+    """
+    # One interned string shared by every node and edge
+    timestamp = sys.intern(datetime.utcnow().isoformat() + 'Z')
+    
+    kg: Dict[str, Any] = {
+        "metadata": _kg_metadata(timestamp),
+        "nodes": list(_kg_nodes(relations, summary, timestamp)),
+        "edges": list(_kg_edges(*_edge_groups(relations), timestamp))
+    }
     
     # Update metadata
     kg["metadata"]["total_nodes"] = len(kg["nodes"])
@@ -1114,6 +1451,12 @@ def build_multi_event_knowledge_graph(relations: Dict, summary: Dict) -> Dict:
     return kg
 
 
+CSV_EXPORT_COLUMNS: Final[List[str]] = [
+    'source', 'source_type', 'target', 'target_type', 'relation',
+    'polarity', 'title', 'pattern', 'date', 'url',
+]
+
+
 def export_to_csv(relations: Dict, output_dir: str = 'output'):
     """
     Export relationships to CSV format.
@@ -1122,45 +1465,42 @@ def export_to_csv(relations: Dict, output_dir: str = 'output'):
     import os
     os.makedirs(output_dir, exist_ok=True)
     
-    # Combine all edges
-    all_edges = []
-    
-    for edge in relations['event_edges']:
-        event, target, target_type, direction, title, pattern, date, url = edge
-        all_edges.append({
-            'source': event,
-            'source_type': 'event',
-            'target': target,
-            'target_type': target_type,
-            'relation': 'TRIGGERS' if target_type == 'mechanism' else 'IMPACTS',
-            'polarity': direction,
-            'title': title,
-            'pattern': pattern,
-            'date': date,
-            'url': url
-        })
-    
-    for edge in relations['mechanism_edges']:
-        mechanism, asset, direction, title, pattern, date, url = edge
-        all_edges.append({
-            'source': mechanism,
-            'source_type': 'mechanism',
-            'target': asset,
-            'target_type': 'asset',
-            'relation': 'IMPACTS',
-            'polarity': direction,
-            'title': title,
-            'pattern': pattern,
-            'date': date,
-            'url': url
-        })
-    
-    df = pd.DataFrame(all_edges)
+    # Build each edge type as a frame straight from its tuples, then stack
+    event_edges = pd.DataFrame(relations['event_edges'], columns=EVENT_EDGE_FIELDS).rename(
+        columns={'event': 'source', 'direction': 'polarity'}
+    )
+    event_edges['source_type'] = 'event'
+    event_edges['relation'] = event_edges['target_type'].eq('mechanism').map(
+        {True: 'TRIGGERS', False: 'IMPACTS'}
+    )
+    
+    mechanism_edges = pd.DataFrame(relations['mechanism_edges'], columns=MECHANISM_EDGE_FIELDS).rename(
+        columns={'mechanism': 'source', 'asset': 'target', 'direction': 'polarity'}
+    )
+    mechanism_edges['source_type'] = 'mechanism'
+    mechanism_edges['target_type'] = 'asset'
+    mechanism_edges['relation'] = 'IMPACTS'
+    
+    df = pd.concat([event_edges, mechanism_edges], ignore_index=True)[CSV_EXPORT_COLUMNS]
     output_path = os.path.join(output_dir, 'multi_event_causal_relationships.csv')
+    # Always pandas: the file's quoting must not depend on optional packages
     df.to_csv(output_path, index=False, encoding='utf-8')
     print(f"\n Relationships exported to: {output_path}")
 
 
+def _json_bytes(obj, indent: int = 0) -> bytes:
+    """
+    Serialize obj as 2-space indented UTF-8 JSON, nested `indent` spaces deep.
+    Values JSON has no type for (e.g. Timestamp dates in hand-built edges)
+    are written as str by the serializer instead of being checked per edge.
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+    return data.replace(b'\n', b'\n' + b' ' * indent) if indent else data
+
+
 def export_to_json(kg: Dict, output_dir: str = 'output'):
     """
     Export knowledge graph to JSON file in the output directory.
@@ -1169,22 +1509,78 @@ def export_to_json(kg: Dict, output_dir: str = 'output'):
     os.makedirs(output_dir, exist_ok=True)
     
     output_path = os.path.join(output_dir, 'multi_event_causal_kg.json')
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(kg, f, indent=2, ensure_ascii=False)
+    with open(output_path, 'wb') as f:
+        f.write(_json_bytes(kg))
     
     print(f"\n Knowledge graph exported to: {output_path}")
     print(f"  - {kg['metadata']['total_nodes']} nodes")
     print(f"  - {kg['metadata']['total_edges']} edges")
 
 
+def _write_json_array(f, key: str, items) -> int:
+    """Write `"key": [...]` one item at a time; returns the item count."""
+    f.write(b'  "' + key.encode('utf-8') + b'": [')
+    count = 0
+    for item in items:
+        f.write(b',\n    ' if count else b'\n    ')
+        f.write(_json_bytes(item, indent=4))
+        count += 1
+    f.write(b'\n  ]' if count else b']')
+    return count
+
+
+def export_kg_stream(relations: Dict, summary: Dict, output_dir: str = 'output') -> Dict:
+    """
+    Build the knowledge graph and write it to the same JSON file as
+    export_to_json, with the same key order (metadata, nodes, edges).
+    
+    Edges are still aggregated in full first, since each needs all of its
+    evidence, but edge dicts are built and serialized one at a time: the
+    complete edge list and the whole serialized document are never held
+    in memory.
+    
+    Returns:
+        The KG metadata dictionary
+    """
+    import os
+    os.makedirs(output_dir, exist_ok=True)
+    
+    timestamp = sys.intern(datetime.utcnow().isoformat() + 'Z')
+    
+    # Totals go in the metadata, which comes first: count nodes and edge
+    # groups before anything is written
+    nodes = list(_kg_nodes(relations, summary, timestamp))
+    event_groups, mechanism_groups = _edge_groups(relations)
+    metadata = _kg_metadata(timestamp)
+    metadata["total_nodes"] = len(nodes)
+    metadata["total_edges"] = len(event_groups) + len(mechanism_groups)
+    
+    output_path = os.path.join(output_dir, 'multi_event_causal_kg.json')
+    with open(output_path, 'wb') as f:
+        f.write(b'{\n  "metadata": ' + _json_bytes(metadata, indent=2) + b',\n')
+        _write_json_array(f, 'nodes', nodes)
+        f.write(b',\n')
+        _write_json_array(f, 'edges', _kg_edges(event_groups, mechanism_groups, timestamp))
+        f.write(b'\n}')
+    
+    print(f"\n Knowledge graph exported to: {output_path}")
+    print(f"  - {metadata['total_nodes']} nodes")
+    print(f"  - {metadata['total_edges']} edges")
+    return metadata
+
+
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
 
-def main():
+def main(n_jobs: int = 1):
     """
     Main execution function.
     Loads news headlines from multi_event.csv and constructs the knowledge graph.
+    
+    Args:
+        n_jobs: Worker processes for headline analysis, as in
+            extract_multi_event_relations
     """
     import os
     
@@ -1212,14 +1608,14 @@ def main():
         print(f"  - Columns: {list(df.columns)}")
         
         # Try to find article title column
-        title_col = None
-        for col in df.columns:
-            if 'title' in col.lower() or 'headline' in col.lower():
-                title_col = col
-                break
+        title_col = next(
+            (col for col in df.columns
+             if 'title' in (col_lower := str(col).lower()) or 'headline' in col_lower),
+            None
+        )
         
         # If no title column found, use first column
-        if not title_col:
+        if title_col is None:
             title_col = df.columns[0]
             print(f"\nNo 'title' or 'headline' column found.")
             print(f"  Using first column '{title_col}' as headlines.")
@@ -1234,7 +1630,7 @@ def main():
         return
     
     print("\nExtracting causal relationships...")
-    relations = extract_multi_event_relations(titles, df)
+    relations = extract_multi_event_relations(titles, df, n_jobs=n_jobs)
     
     print("\nGenerating summary statistics...")
     summary = summarize_relations(relations)
@@ -1246,8 +1642,7 @@ def main():
     
     # Build and export JSON knowledge graph (in output folder)
     print("\nBuilding JSON knowledge graph...")
-    kg = build_multi_event_knowledge_graph(relations, summary)
-    export_to_json(kg, output_dir)
+    export_kg_stream(relations, summary, output_dir)
     
     print("\n" + "=" * 100)
     print("EXTRACTION COMPLETE")
@@ -1259,4 +1654,9 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Multi-event causal knowledge graph extraction")
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help="worker processes for headline analysis (-1: one per CPU; default: 1)")
+    main(n_jobs=parser.parse_args().jobs)
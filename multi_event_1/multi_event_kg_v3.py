@@ -106,17 +106,8 @@ def detect_event_type(text: str) -> Dict[str, bool]:
 
 def detect_assets(text: str) -> Set[str]:
     """Detect all asset types mentioned in the text."""
-    text_lower = text.lower()
-    detected = set()
-    
-    for asset_id, keywords in ASSET_KEYWORDS.items():
-        for keyword in keywords:
-            pattern = r'\b' + re.escape(keyword) + r"'?s?\b"
-            if re.search(pattern, text_lower):
-                detected.add(asset_id)
-                break
-    
-    return detected
+    # One scan over the shared keyword pattern instead of a search per keyword
+    return _config.find_assets(text)
 
 
 def detect_mechanisms(text: str) -> Set[str]:
@@ -317,15 +308,7 @@ def extract_asset_movement_pairs(text: str) -> Dict[str, str]:
     
     # Process each clause
     for clause in clauses:
-        clause_assets = set()
-        clause_direction = 'neutral'
-        
-        for asset_id in all_assets:
-            keywords = ASSET_KEYWORDS[asset_id]
-            for keyword in keywords:
-                if re.search(r'\b' + re.escape(keyword) + r"'?s?\b", clause):
-                    clause_assets.add(asset_id)
-                    break
+        clause_assets = _config.find_assets(clause) & all_assets
         
         clause_direction = infer_direction_from_clause(clause)
         
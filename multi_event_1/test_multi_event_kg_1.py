@@ -0,0 +1,44 @@
+"""Tests for multi_event_kg_1 extraction."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import multi_event_kg_1 as kg
+
+MINI_CSV = Path(__file__).with_name('multi_event_mini.csv')
+
+
+@pytest.fixture(scope='module')
+def headlines():
+    df = pd.read_csv(MINI_CSV)
+    return df['Article_title'].tolist(), df
+
+
+def test_parallel_extraction_matches_serial(headlines, tmp_path):
+    titles, df = headlines
+    serial = kg.extract_multi_event_relations(titles, df)
+    parallel = kg.extract_multi_event_relations(titles, df, n_jobs=2)
+
+    assert serial['event_edges']
+    assert parallel == serial
+
+    # Edge order decides edge ids, so the exported files must match too
+    kg.export_to_csv(serial, str(tmp_path / 'serial'))
+    kg.export_to_csv(parallel, str(tmp_path / 'parallel'))
+    csv_name = 'multi_event_causal_relationships.csv'
+    assert (tmp_path / 'parallel' / csv_name).read_bytes() == (tmp_path / 'serial' / csv_name).read_bytes()
+
+    summary = kg.summarize_relations(serial)
+    serial_edges = kg.build_multi_event_knowledge_graph(serial, summary)['edges']
+    parallel_edges = kg.build_multi_event_knowledge_graph(parallel, summary)['edges']
+    for edge in serial_edges + parallel_edges:
+        del edge['last_updated']
+    assert parallel_edges == serial_edges
+
+
+@pytest.mark.parametrize('n_jobs', [0, -2])
+def test_invalid_n_jobs_is_rejected(n_jobs):
+    with pytest.raises(ValueError, match='n_jobs'):
+        kg.extract_multi_event_relations(['Stocks rally after jobs report'], n_jobs=n_jobs)